@@ -7,32 +7,94 @@ Data: Janeiro 2026
 """
 
 import asyncio
+import atexit
+import copy
 import json
+import logging
+import logging.handlers
 import os
-from typing import Any, Optional, Dict, List
-import requests
-from datetime import datetime, timedelta
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+import httpx
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
-    Resource,
     Tool,
     TextContent,
     ImageContent,
     EmbeddedResource,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional; usa o json da biblioteca padrão
+    orjson = None
+
+__all__ = [
+    "server",
+    "carregar_municipios",
+    "obter_cliente_http",
+    "fechar_cliente_http",
+    "buscar_info_painel_alertas",
+    "buscar_municipios_monitorados",
+    "buscar_info_monitoramento",
+    "buscar_links_uteis",
+    "buscar_dashboard_completo",
+    "handle_list_tools",
+    "handle_call_tool",
+    "main",
+]
+
 # ====================
 # CONFIGURAÇÕES
 # ====================
 
 CEMADEN_PAINEL_BASE = "https://painelalertas.cemaden.gov.br"
 CEMADEN_MAPA_BASE = "https://mapainterativo.cemaden.gov.br"
+CEMADEN_PAINEL_URL = f"{CEMADEN_PAINEL_BASE}/"
+CEMADEN_MAPA_URL = f"{CEMADEN_MAPA_BASE}/"
+CEMADEN_SITE_URL = "http://www.cemaden.gov.br"
+CEMADEN_EDUCACAO_URL = "https://educacao.cemaden.gov.br/"
 TIMEOUT_SEGUNDOS = 15
+TIMEOUT_CONEXAO_SEGUNDOS = 3
+# Máximo de requisições simultâneas ao CEMADEN (tamanho do pool de conexões)
+HTTP_MAX_CONEXOES = 10
+PAINEL_CACHE_TTL_SEGUNDOS = 60
+PAINEL_CACHE_TTL_FALHA_SEGUNDOS = 10
+LOG_ARQUIVO = "cemaden_mcp_debug.log"
+
+# Tamanho máximo aceito para os parâmetros de texto das ferramentas
+MAX_TAMANHO_ESTADO = 8
+MAX_TAMANHO_TIPO = 16
+
+# Com CEMADEN_DEBUG=1, cada chamada de ferramenta também é exibida no stderr
+CEMADEN_DEBUG = os.environ.get("CEMADEN_DEBUG") == "1"
 
-# Cache de municípios carregado na inicialização
-MUNICIPIOS_CACHE: Optional[Dict[str, List[str]]] = None
+# Cliente HTTP assíncrono reutilizado entre chamadas (criado sob demanda) e o
+# event loop em que foi criado: suas conexões keep-alive só valem nesse loop
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_HTTP_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+# Último resultado da verificação do painel de alertas (nunca entregue
+# diretamente: buscar_info_painel_alertas devolve cópias), em "conteudo" a
+# resposta MCP já serializada para esse resultado e, em "pendente", a
+# verificação em andamento (compartilhada pelas chamadas concorrentes)
+_PAINEL_CACHE: Dict[str, Any] = {
+    "ts": 0.0, "ttl": 0.0, "result": None, "conteudo": None, "pendente": None
+}
+
+# Arquivo de municípios, lido uma única vez na primeira consulta
+_MUNICIPIOS_PATH = Path(__file__).with_name("municipios.json")
+_MUNICIPIOS_LOCK = threading.Lock()
+_MUNICIPIOS: Optional[Mapping[str, Tuple[str, ...]]] = None
+_UF_SET: frozenset = frozenset()
+_UF_ORDENADAS: Tuple[str, ...] = ()
 
 # ====================
 # SERVIDOR MCP
@@ -40,59 +102,215 @@ MUNICIPIOS_CACHE: Optional[Dict[str, List[str]]] = None
 
 server = Server("cemaden-monitor-server")
 
+# Logs vão para uma fila limitada; o QueueListener iniciado em main() grava no
+# arquivo em uma thread separada, fora do event loop
+_LOG_QUEUE: queue.Queue = queue.Queue(maxsize=10000)
+
+
+class _ArquivoLogEmLote(logging.FileHandler):
+    """
+    FileHandler com buffer de 64 KiB que só descarrega o arquivo quando a fila
+    de logs esvazia: em rajadas de chamadas, vários registros saem em uma única
+    escrita no disco.
+    """
+    
+    def __init__(self, fila: queue.Queue, *args: Any, **kwargs: Any) -> None:
+        self._fila = fila
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def flush(self) -> None:
+        # O buffer restante é gravado de qualquer forma no close()
+        if self._fila.empty():
+            super().flush()
+
+
+class _OuvinteLogComEspera(logging.handlers.QueueListener):
+    """
+    QueueListener cujo stop() espera até TIMEOUT_SEGUNDOS por espaço na fila
+    para o sentinela de encerramento, em vez de falhar com a fila cheia e
+    perder os registros ainda pendentes.
+    """
+    
+    TIMEOUT_SEGUNDOS = 5
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel, timeout=self.TIMEOUT_SEGUNDOS)
+    
+    def stop(self) -> None:
+        try:
+            super().stop()
+        except queue.Full:
+            # Disco travado: sem o sentinela a thread nunca terminaria, então
+            # não há o que aguardar (ela é daemon e morre com o processo)
+            pass
+
+
+_LOG_FILE_HANDLER = _ArquivoLogEmLote(_LOG_QUEUE, LOG_ARQUIVO, encoding="utf-8", delay=True)
+_LOG_FILE_HANDLER.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+_LOG_LISTENER = _OuvinteLogComEspera(_LOG_QUEUE, _LOG_FILE_HANDLER)
+
+
+class _FilaLogDescartavel(logging.handlers.QueueHandler):
+    """
+    QueueHandler que descarta o registro quando a fila está cheia (disco
+    travado, por exemplo), em vez de imprimir um traceback a cada chamada.
+    """
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+# O QueueHandler só é ligado em main(), junto com o listener: quem importa o
+# módulo sem rodar o servidor não acumula registros numa fila sem consumidor
+_LOG_QUEUE_HANDLER = _FilaLogDescartavel(_LOG_QUEUE)
+
+logger = logging.getLogger("cemaden")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(logging.NullHandler())
+
 # ====================
 # FUNÇÕES UTILITÁRIAS
 # ====================
 
-def carregar_municipios() -> Dict[str, List[str]]:
+# Respostas MCP são lidas por máquina: JSON compacto, sem indentação
+if orjson is not None:
+    def _dump(dados: Any) -> str:
+        """Serializa a resposta de uma ferramenta em JSON compacto (orjson)."""
+        return orjson.dumps(dados, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    def _dump(dados: Any) -> str:
+        """Serializa a resposta de uma ferramenta em JSON compacto."""
+        return json.dumps(dados, ensure_ascii=False, separators=(",", ":"))
+
+
+def _argumento_valido(valor: Any, tamanho_maximo: int) -> bool:
     """
-    Carrega dados de municípios do arquivo JSON.
+    Verifica se um parâmetro opcional de texto é aceitável antes de normalizá-lo.
+    
+    Args:
+        valor: Valor recebido do cliente MCP
+        tamanho_maximo: Número máximo de caracteres
     
     Returns:
-        Dicionário com estados como chaves e lista de municípios como valores
+        True se o valor for None ou uma string dentro do limite
     """
-    global MUNICIPIOS_CACHE
-    
-    if MUNICIPIOS_CACHE is not None:
-        return MUNICIPIOS_CACHE
+    return valor is None or (isinstance(valor, str) and len(valor) <= tamanho_maximo)
+
+
+def _ler_municipios() -> Mapping[str, Tuple[str, ...]]:
+    """
+    Lê o arquivo municipios.json.
     
+    Returns:
+        Mapeamento somente leitura de estado para tupla de municípios
+    """
     try:
-        arquivo = os.path.join(os.path.dirname(__file__), "municipios.json")
-        with open(arquivo, "r", encoding="utf-8") as f:
-            MUNICIPIOS_CACHE = json.load(f)
-            return MUNICIPIOS_CACHE
+        conteudo = _MUNICIPIOS_PATH.read_bytes()
+        dados = orjson.loads(conteudo) if orjson is not None else json.loads(conteudo)
+        return MappingProxyType({uf: tuple(municipios) for uf, municipios in dados.items()})
     except FileNotFoundError:
-        print("⚠️  Arquivo municipios.json não encontrado")
-        return {}
+        print("⚠️  Arquivo municipios.json não encontrado", file=sys.stderr)
     except json.JSONDecodeError as e:
-        print(f"❌ Erro ao decodificar municipios.json: {e}")
-        return {}
+        print(f"❌ Erro ao decodificar municipios.json: {e}", file=sys.stderr)
     except Exception as e:
-        print(f"❌ Erro ao carregar municipios.json: {e}")
-        return {}
+        print(f"❌ Erro ao carregar municipios.json: {e}", file=sys.stderr)
+    return MappingProxyType({})
+
+
+def carregar_municipios() -> Mapping[str, Tuple[str, ...]]:
+    """
+    Carrega dados de municípios na primeira chamada e os reutiliza depois.
+    Seguro para chamadas concorrentes de threads diferentes.
+    
+    Returns:
+        Mapeamento com estados como chaves e tupla de municípios como valores
+    """
+    global _MUNICIPIOS, _UF_SET, _UF_ORDENADAS
+    
+    if _MUNICIPIOS is None:
+        with _MUNICIPIOS_LOCK:
+            if _MUNICIPIOS is None:
+                dados = _ler_municipios()
+                _UF_SET = frozenset(dados)
+                _UF_ORDENADAS = tuple(sorted(dados))
+                _MUNICIPIOS = dados
+    return _MUNICIPIOS
+
+
+def obter_cliente_http() -> httpx.AsyncClient:
+    """
+    Retorna o cliente HTTP compartilhado, criando-o na primeira chamada.
+    Um novo cliente é criado se o event loop atual não for o mesmo em que o
+    cliente existente foi criado (por exemplo, após outro asyncio.run()).
+    
+    Returns:
+        Cliente assíncrono com pool de conexões keep-alive
+    """
+    global HTTP_CLIENT, _HTTP_CLIENT_LOOP
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    # O cliente de um loop anterior (em geral já encerrado) não pode ser
+    # fechado a partir deste; é apenas descartado
+    if HTTP_CLIENT is None or HTTP_CLIENT.is_closed or _HTTP_CLIENT_LOOP is not loop:
+        # Com transport explícito o httpx ignora o limits= do cliente: os
+        # limites do pool precisam ficar no próprio transport
+        HTTP_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(TIMEOUT_SEGUNDOS, connect=TIMEOUT_CONEXAO_SEGUNDOS),
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(max_connections=HTTP_MAX_CONEXOES, keepalive_expiry=30),
+            ),
+        )
+        _HTTP_CLIENT_LOOP = loop
+    return HTTP_CLIENT
+
+
+async def fechar_cliente_http() -> None:
+    """
+    Fecha o cliente HTTP compartilhado, se existir.
+    """
+    global HTTP_CLIENT, _HTTP_CLIENT_LOOP
+    
+    if HTTP_CLIENT is not None:
+        if _HTTP_CLIENT_LOOP is asyncio.get_running_loop():
+            await HTTP_CLIENT.aclose()
+        HTTP_CLIENT = None
+        _HTTP_CLIENT_LOOP = None
 
 
 # ====================
 # FUNÇÕES DE API
 # ====================
 
-def buscar_info_painel_alertas() -> Dict[str, Any]:
+async def _verificar_painel() -> None:
     """
-    Busca informações da página de alertas do CEMADEN.
-    Valida conexão com o painel interativo.
-    
-    Returns:
-        Dicionário com informações dos alertas
+    Valida a conexão com o painel interativo (requisição HEAD) e grava em
+    _PAINEL_CACHE o resultado e a resposta MCP correspondente.
     """
+    url = CEMADEN_PAINEL_URL
     try:
-        url = f"{CEMADEN_PAINEL_BASE}/"
-        
-        print(f"🔍 Acessando painel de alertas: {url}")
-        response = requests.get(url, timeout=TIMEOUT_SEGUNDOS)
+        print(f"🔍 Acessando painel de alertas: {url}", file=sys.stderr)
+        response = await obter_cliente_http().head(
+            url,
+            timeout=httpx.Timeout(5, connect=TIMEOUT_CONEXAO_SEGUNDOS),
+            follow_redirects=True,
+        )
         response.raise_for_status()
         
         # Retorna informações do painel
-        return {
+        resultado = {
             "sucesso": True,
             "url_painel": url,
             "mensagem": "O CEMADEN disponibiliza alertas através do painel interativo. "
@@ -106,23 +324,69 @@ def buscar_info_painel_alertas() -> Dict[str, Any]:
             },
             "acesso_direto": url
         }
+        ttl = PAINEL_CACHE_TTL_SEGUNDOS
     
-    except requests.exceptions.Timeout:
-        print(f"⏱️  Timeout ao acessar painel de alertas")
-        return {
+    except httpx.TimeoutException:
+        print(f"⏱️  Timeout ao acessar painel de alertas", file=sys.stderr)
+        resultado = {
             "sucesso": False,
             "erro": "Timeout ao acessar painel de alertas",
-            "url_alternativa": "https://painelalertas.cemaden.gov.br/",
+            "url_alternativa": CEMADEN_PAINEL_URL,
             "nota": "Acesse o link diretamente no navegador para visualizar alertas ativos"
         }
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Erro ao acessar painel: {str(e)}")
-        return {
+        ttl = PAINEL_CACHE_TTL_FALHA_SEGUNDOS
+    except httpx.HTTPError as e:
+        print(f"❌ Erro ao acessar painel: {str(e)}", file=sys.stderr)
+        resultado = {
             "sucesso": False,
             "erro": f"Erro ao acessar painel de alertas: {str(e)}",
-            "url_alternativa": "https://painelalertas.cemaden.gov.br/",
+            "url_alternativa": CEMADEN_PAINEL_URL,
             "nota": "Acesse o link diretamente no navegador para visualizar alertas ativos"
         }
+        ttl = PAINEL_CACHE_TTL_FALHA_SEGUNDOS
+    
+    _PAINEL_CACHE.update(
+        ts=time.monotonic(),
+        ttl=ttl,
+        result=resultado,
+        conteudo=_conteudo_texto(_dump(resultado)),
+        pendente=None,
+    )
+
+
+async def _painel_em_cache() -> Dict[str, Any]:
+    """
+    Retorna _PAINEL_CACHE com um resultado válido, verificando o painel se o
+    cache estiver vencido. Chamadas concorrentes com o cache vencido aguardam
+    uma única requisição.
+    """
+    agora = time.monotonic()
+    if _PAINEL_CACHE["result"] is not None and agora - _PAINEL_CACHE["ts"] < _PAINEL_CACHE["ttl"]:
+        return _PAINEL_CACHE
+    
+    # Uma verificação de outro event loop (já encerrado) não é reaproveitada
+    pendente = _PAINEL_CACHE["pendente"]
+    if pendente is None or pendente.done() or pendente.get_loop() is not asyncio.get_running_loop():
+        pendente = asyncio.ensure_future(_verificar_painel())
+        _PAINEL_CACHE["pendente"] = pendente
+    
+    # shield: o cancelamento de uma chamada não interrompe as demais
+    await asyncio.shield(pendente)
+    return _PAINEL_CACHE
+
+
+async def buscar_info_painel_alertas() -> Dict[str, Any]:
+    """
+    Busca informações da página de alertas do CEMADEN.
+    Valida conexão com o painel interativo (requisição HEAD).
+    
+    O resultado fica em cache por PAINEL_CACHE_TTL_SEGUNDOS em caso de
+    sucesso e por PAINEL_CACHE_TTL_FALHA_SEGUNDOS em caso de falha.
+    
+    Returns:
+        Dicionário com informações dos alertas (cópia independente do cache)
+    """
+    return copy.deepcopy((await _painel_em_cache())["result"])
 
 
 def buscar_municipios_monitorados(estado: Optional[str] = None) -> Dict[str, Any]:
@@ -135,6 +399,14 @@ def buscar_municipios_monitorados(estado: Optional[str] = None) -> Dict[str, Any
     Returns:
         Dicionário com municípios ou mensagem de erro
     """
+    # Rejeita entradas absurdas antes de qualquer cópia via strip()/upper()
+    if not _argumento_valido(estado, MAX_TAMANHO_ESTADO):
+        return {
+            "sucesso": False,
+            "erro": "Parâmetro 'estado' inválido",
+            "nota": "Use a sigla do estado (ex: SP, RJ, MG)"
+        }
+    
     try:
         municipios_data = carregar_municipios()
         
@@ -147,16 +419,14 @@ def buscar_municipios_monitorados(estado: Optional[str] = None) -> Dict[str, Any
             }
         
         # Se especificou estado, valida e retorna
-        if estado:
-            estado_upper = estado.upper().strip()
-            
-            if estado_upper not in municipios_data:
-                estados_disponiveis = sorted(municipios_data.keys())
+        estado_upper = estado.strip().upper() if estado else None
+        if estado_upper is not None:
+            if estado_upper not in _UF_SET:
                 return {
                     "sucesso": False,
                     "erro": f"Estado '{estado}' não encontrado",
-                    "estados_disponiveis": estados_disponiveis,
-                    "total_estados": len(estados_disponiveis),
+                    "estados_disponiveis": list(_UF_ORDENADAS),
+                    "total_estados": len(_UF_ORDENADAS),
                     "nota": "Use a sigla do estado (ex: SP, RJ, MG)"
                 }
             
@@ -165,7 +435,7 @@ def buscar_municipios_monitorados(estado: Optional[str] = None) -> Dict[str, Any
                 "sucesso": True,
                 "estado": estado_upper,
                 "total": len(municipios),
-                "municipios": municipios,
+                "municipios": list(municipios),
                 "fonte": "CEMADEN - Centro Nacional de Monitoramento e Alertas de Desastres Naturais"
             }
         
@@ -175,8 +445,8 @@ def buscar_municipios_monitorados(estado: Optional[str] = None) -> Dict[str, Any
             "sucesso": True,
             "total_municipal": total_municipios,
             "total_estados": len(municipios_data),
-            "estados_disponiveis": sorted(municipios_data.keys()),
-            "municipios_por_estado": municipios_data,
+            "estados_disponiveis": list(_UF_ORDENADAS),
+            "municipios_por_estado": {uf: list(m) for uf, m in municipios_data.items()},
             "fonte": "CEMADEN",
             "nota": "Para filtrar por estado, use o parâmetro 'estado' com a sigla (SP, RJ, MG, etc)"
         }
@@ -199,9 +469,9 @@ def buscar_info_monitoramento() -> Dict[str, Any]:
         "sucesso": True,
         "cemaden": {
             "nome_completo": "Centro Nacional de Monitoramento e Alertas de Desastres Naturais",
-            "website": "http://www.cemaden.gov.br",
-            "painel_alertas": "https://painelalertas.cemaden.gov.br/",
-            "mapa_interativo": "https://mapainterativo.cemaden.gov.br/"
+            "website": CEMADEN_SITE_URL,
+            "painel_alertas": CEMADEN_PAINEL_URL,
+            "mapa_interativo": CEMADEN_MAPA_URL
         },
         "monitoramento": {
             "total_municipios": 959,
@@ -247,6 +517,63 @@ def buscar_info_monitoramento() -> Dict[str, Any]:
     }
 
 
+# Links organizados por categoria, em forma bruta; o restante do módulo usa
+# a versão congelada _LINKS_CEMADEN
+_LINKS_CEMADEN_FONTE = {
+    "alertas": {
+        "titulo": "Sistema de Alertas",
+        "links": [
+            {
+                "nome": "Painel de Alertas",
+                "url": CEMADEN_PAINEL_URL,
+                "descricao": "Visualização de alertas ativos por estado e município"
+            }
+        ]
+    },
+    "dados": {
+        "titulo": "Dados e Monitoramento",
+        "links": [
+            {
+                "nome": "Mapa Interativo",
+                "url": CEMADEN_MAPA_URL,
+                "descricao": "Dados de pluviômetros em tempo real e download de histórico"
+            },
+            {
+                "nome": "Site Oficial",
+                "url": CEMADEN_SITE_URL,
+                "descricao": "Portal principal do CEMADEN"
+            }
+        ]
+    },
+    "educacao": {
+        "titulo": "CEMADEN Educação",
+        "links": [
+            {
+                "nome": "Portal Educação",
+                "url": CEMADEN_EDUCACAO_URL,
+                "descricao": "Projeto educacional sobre percepção de riscos"
+            }
+        ]
+    }
+}
+
+# Congelados em todos os níveis: buscar_links_uteis devolve cópias, e só as
+# respostas MCP pré-serializadas compartilham o conteúdo entre chamadas
+_LINKS_CEMADEN: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    categoria: MappingProxyType({
+        "titulo": conteudo["titulo"],
+        "links": tuple(MappingProxyType(link) for link in conteudo["links"]),
+    })
+    for categoria, conteudo in _LINKS_CEMADEN_FONTE.items()
+})
+
+
+def _copiar_categoria_links(categoria: str) -> Dict[str, Any]:
+    """Monta uma cópia independente (dicts e listas novos) de uma categoria."""
+    conteudo = _LINKS_CEMADEN[categoria]
+    return {"titulo": conteudo["titulo"], "links": [dict(link) for link in conteudo["links"]]}
+
+
 def buscar_links_uteis(tipo: Optional[str] = None) -> Dict[str, Any]:
     """
     Retorna links úteis do CEMADEN.
@@ -257,148 +584,228 @@ def buscar_links_uteis(tipo: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Dicionário com links organizados por categoria
     """
-    links = {
-        "alertas": {
-            "titulo": "Sistema de Alertas",
-            "links": [
-                {
-                    "nome": "Painel de Alertas",
-                    "url": "https://painelalertas.cemaden.gov.br/",
-                    "descricao": "Visualização de alertas ativos por estado e município"
-                }
-            ]
-        },
-        "dados": {
-            "titulo": "Dados e Monitoramento",
-            "links": [
-                {
-                    "nome": "Mapa Interativo",
-                    "url": "https://mapainterativo.cemaden.gov.br/",
-                    "descricao": "Dados de pluviômetros em tempo real e download de histórico"
-                },
-                {
-                    "nome": "Site Oficial",
-                    "url": "http://www.cemaden.gov.br",
-                    "descricao": "Portal principal do CEMADEN"
-                }
-            ]
-        },
-        "educacao": {
-            "titulo": "CEMADEN Educação",
-            "links": [
-                {
-                    "nome": "Portal Educação",
-                    "url": "https://educacao.cemaden.gov.br/",
-                    "descricao": "Projeto educacional sobre percepção de riscos"
-                }
-            ]
+    if not _argumento_valido(tipo, MAX_TAMANHO_TIPO):
+        return {
+            "sucesso": False,
+            "erro": "Parâmetro 'tipo' inválido",
+            "nota": "Use 'alertas', 'dados' ou 'educacao'"
         }
+    
+    categoria = tipo.lower() if tipo else None
+    if categoria in _LINKS_CEMADEN:
+        return {"sucesso": True, "categoria": categoria, **_copiar_categoria_links(categoria)}
+    return {
+        "sucesso": True,
+        "todas_categorias": {c: _copiar_categoria_links(c) for c in _LINKS_CEMADEN}
     }
+
+
+async def buscar_dashboard_completo() -> Dict[str, Any]:
+    """
+    Reúne painel de alertas, informações do sistema e links úteis em uma
+    única resposta.
     
-    if tipo and tipo.lower() in links:
-        return {
-            "sucesso": True,
-            "categoria": tipo.lower(),
-            **links[tipo.lower()]
-        }
-    else:
-        return {
-            "sucesso": True,
-            "todas_categorias": links
-        }
+    Returns:
+        Dicionário com as chaves "painel", "info" e "links"
+    """
+    # Só o painel depende de rede; info e links são montados em memória
+    return {
+        "sucesso": True,
+        "painel": await buscar_info_painel_alertas(),
+        "info": buscar_info_monitoramento(),
+        "links": buscar_links_uteis()
+    }
+
+
+# ====================
+# RESPOSTAS PRÉ-SERIALIZADAS
+# ====================
+# Conteúdo imutável em tempo de execução: serializado e embrulhado em
+# TextContent uma única vez (na importação ou na primeira consulta)
+
+def _conteudo_texto(texto: str) -> list[TextContent]:
+    """Embrulha o texto JSON de uma resposta no formato de retorno do MCP."""
+    return [TextContent(type="text", text=texto)]
+
+
+_RESPOSTA_INFO_MONITORAMENTO = _conteudo_texto(_dump(buscar_info_monitoramento()))
+
+_RESPOSTAS_LINKS_POR_TIPO = MappingProxyType({
+    tipo: _conteudo_texto(_dump(buscar_links_uteis(tipo))) for tipo in (None, *_LINKS_CEMADEN)
+})
+
+# Uma resposta por UF (e a lista completa em None), montada na primeira
+# consulta de municípios
+_RESPOSTAS_MUNICIPIOS_POR_UF: Optional[Mapping[Optional[str], list[TextContent]]] = None
+
+
+def _respostas_municipios_por_uf() -> Mapping[Optional[str], list[TextContent]]:
+    """Retorna as respostas de municípios por UF, montando-as na primeira chamada."""
+    global _RESPOSTAS_MUNICIPIOS_POR_UF
+    
+    if _RESPOSTAS_MUNICIPIOS_POR_UF is None:
+        _RESPOSTAS_MUNICIPIOS_POR_UF = MappingProxyType({
+            uf: _conteudo_texto(_dump(buscar_municipios_monitorados(uf)))
+            for uf in (None, *carregar_municipios())
+        })
+    return _RESPOSTAS_MUNICIPIOS_POR_UF
+
+
+# ====================
+# DESPACHO DE FERRAMENTAS
+# ====================
+# Cada ferramenta é registrada com a função que monta a resposta e os nomes
+# dos argumentos MCP que ela recebe (repassados como parâmetros nomeados)
+
+async def _responder_painel_alertas() -> list[TextContent]:
+    # A resposta serializada é montada junto com o resultado em cache
+    return (await _painel_em_cache())["conteudo"]
+
+
+async def _responder_municipios(estado: Optional[str]) -> list[TextContent]:
+    resposta = None
+    if _argumento_valido(estado, MAX_TAMANHO_ESTADO):
+        resposta = _respostas_municipios_por_uf().get(estado.strip().upper() if estado else None)
+    if resposta is None:
+        # Estado inválido: a mensagem de erro depende do valor recebido
+        resposta = _conteudo_texto(_dump(buscar_municipios_monitorados(estado)))
+    return resposta
+
+
+async def _responder_info_monitoramento() -> list[TextContent]:
+    return _RESPOSTA_INFO_MONITORAMENTO
+
+
+async def _responder_links(tipo: Optional[str]) -> list[TextContent]:
+    if not _argumento_valido(tipo, MAX_TAMANHO_TIPO):
+        return _conteudo_texto(_dump(buscar_links_uteis(tipo)))
+    return _RESPOSTAS_LINKS_POR_TIPO.get(tipo.lower() if tipo else None, _RESPOSTAS_LINKS_POR_TIPO[None])
+
+
+async def _responder_dashboard() -> list[TextContent]:
+    return _conteudo_texto(_dump(await buscar_dashboard_completo()))
+
+
+_TOOL_DISPATCH: Dict[str, Tuple[Callable[..., Awaitable[list[TextContent]]], Tuple[str, ...]]] = {
+    "consultar_painel_alertas": (_responder_painel_alertas, ()),
+    "listar_municipios_monitorados": (_responder_municipios, ("estado",)),
+    "info_sistema_monitoramento": (_responder_info_monitoramento, ()),
+    "links_cemaden": (_responder_links, ("tipo",)),
+    "dashboard_completo": (_responder_dashboard, ()),
+}
 
 
 # ====================
 # HANDLERS MCP
 # ====================
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """
-    Lista todas as ferramentas disponíveis no servidor MCP
-    """
-    return [
-        Tool(
-            name="consultar_painel_alertas",
-            description="""
-            Acessa o painel de alertas do CEMADEN para obter informações sobre alertas ativos
-            de desastres naturais no Brasil.
-            
-            O CEMADEN emite alertas de:
-            - Movimento de Massa (deslizamentos)
-            - Risco Hidrológico (enchentes, enxurradas)
-            
-            Com níveis: Moderado, Alto, Muito Alto
-            
-            Retorna link direto para o painel interativo onde podem ser consultados
-            alertas por estado e município.
-            """,
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
+# Definições das ferramentas: construídas uma única vez na importação
+_TOOLS_CACHED: list[Tool] = [
+    Tool(
+        name="consultar_painel_alertas",
+        description="""
+        Acessa o painel de alertas do CEMADEN para obter informações sobre alertas ativos
+        de desastres naturais no Brasil.
         
-        Tool(
-            name="listar_municipios_monitorados",
-            description="""
-            Lista municípios brasileiros monitorados pelo CEMADEN.
-            
-            O CEMADEN monitora 959 municípios vulneráveis a desastres naturais.
-            Pode filtrar por estado específico (use sigla: SP, RJ, MG, etc.).
-            """,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "estado": {
-                        "type": "string",
-                        "description": "Sigla do estado (SP, RJ, MG, RS, PR, SC, BA, PE, CE, ES, etc.). Opcional.",
-                    },
+        O CEMADEN emite alertas de:
+        - Movimento de Massa (deslizamentos)
+        - Risco Hidrológico (enchentes, enxurradas)
+        
+        Com níveis: Moderado, Alto, Muito Alto
+        
+        Retorna link direto para o painel interativo onde podem ser consultados
+        alertas por estado e município.
+        """,
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    
+    Tool(
+        name="listar_municipios_monitorados",
+        description="""
+        Lista municípios brasileiros monitorados pelo CEMADEN.
+        
+        O CEMADEN monitora 959 municípios vulneráveis a desastres naturais.
+        Pode filtrar por estado específico (use sigla: SP, RJ, MG, etc.).
+        """,
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "estado": {
+                    "type": "string",
+                    "description": "Sigla do estado (SP, RJ, MG, RS, PR, SC, BA, PE, CE, ES, etc.). Opcional.",
                 },
-                "required": [],
             },
-        ),
+            "required": [],
+        },
+    ),
+    
+    Tool(
+        name="info_sistema_monitoramento",
+        description="""
+        Retorna informações completas sobre o sistema de monitoramento do CEMADEN,
+        incluindo tipos de alerta, níveis, rede observacional e como acessar os dados.
         
-        Tool(
-            name="info_sistema_monitoramento",
-            description="""
-            Retorna informações completas sobre o sistema de monitoramento do CEMADEN,
-            incluindo tipos de alerta, níveis, rede observacional e como acessar os dados.
-            
-            Útil para entender como funciona o sistema de alertas e monitoramento.
-            """,
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
+        Útil para entender como funciona o sistema de alertas e monitoramento.
+        """,
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    
+    Tool(
+        name="links_cemaden",
+        description="""
+        Retorna links úteis do CEMADEN organizados por categoria.
         
-        Tool(
-            name="links_cemaden",
-            description="""
-            Retorna links úteis do CEMADEN organizados por categoria.
-            
-            Categorias disponíveis:
-            - alertas: Painel de alertas ativos
-            - dados: Mapa interativo e dados de pluviômetros
-            - educacao: Portal educacional sobre percepção de riscos
-            
-            Se não especificar categoria, retorna todos os links.
-            """,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tipo": {
-                        "type": "string",
-                        "description": "Categoria de links: 'alertas', 'dados' ou 'educacao'. Opcional.",
-                    },
+        Categorias disponíveis:
+        - alertas: Painel de alertas ativos
+        - dados: Mapa interativo e dados de pluviômetros
+        - educacao: Portal educacional sobre percepção de riscos
+        
+        Se não especificar categoria, retorna todos os links.
+        """,
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tipo": {
+                    "type": "string",
+                    "description": "Categoria de links: 'alertas', 'dados' ou 'educacao'. Opcional.",
                 },
-                "required": [],
             },
-        ),
-    ]
+            "required": [],
+        },
+    ),
+    
+    Tool(
+        name="dashboard_completo",
+        description="""
+        Retorna em uma única chamada o painel de alertas, as informações do
+        sistema de monitoramento e todos os links úteis do CEMADEN.
+        
+        Equivale a chamar consultar_painel_alertas, info_sistema_monitoramento
+        e links_cemaden, com uma única resposta.
+        """,
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """
+    Lista todas as ferramentas disponíveis no servidor MCP
+    """
+    return _TOOLS_CACHED
 
 
 @server.call_tool()
@@ -409,49 +816,23 @@ async def handle_call_tool(
     Executa a ferramenta solicitada pelo Claude Desktop
     """
     
-    import sys
+    # Log em arquivo (não bloqueante)
+    logger.info("🔧 Ferramenta: %s | 📥 Argumentos: %s", name, arguments)
     
-    # Log em arquivo
-    try:
-        with open("cemaden_mcp_debug.log", "a", encoding="utf-8") as log_file:
-            log_file.write(f"\n{'='*50}\n")
-            log_file.write(f"🔧 Ferramenta: {name}\n")
-            log_file.write(f"📥 Argumentos: {arguments}\n")
-            log_file.write(f"⏰ {datetime.now()}\n")
-            log_file.write(f"{'='*50}\n")
-    except:
-        pass
-    
-    print(f"\n{'='*50}", file=sys.stderr)
-    print(f"🔧 Executando: {name}", file=sys.stderr)
-    print(f"📥 Argumentos: {arguments}", file=sys.stderr)
-    print(f"{'='*50}\n", file=sys.stderr)
-    
-    # ===== PAINEL DE ALERTAS =====
-    if name == "consultar_painel_alertas":
-        resultado = buscar_info_painel_alertas()
-        return [TextContent(type="text", text=json.dumps(resultado, indent=2, ensure_ascii=False))]
-    
-    # ===== MUNICÍPIOS =====
-    elif name == "listar_municipios_monitorados":
-        estado = arguments.get("estado") if arguments else None
-        resultado = buscar_municipios_monitorados(estado)
-        return [TextContent(type="text", text=json.dumps(resultado, indent=2, ensure_ascii=False))]
-    
-    # ===== INFO SISTEMA =====
-    elif name == "info_sistema_monitoramento":
-        resultado = buscar_info_monitoramento()
-        return [TextContent(type="text", text=json.dumps(resultado, indent=2, ensure_ascii=False))]
-    
-    # ===== LINKS ÚTEIS =====
-    elif name == "links_cemaden":
-        tipo = arguments.get("tipo") if arguments else None
-        resultado = buscar_links_uteis(tipo)
-        return [TextContent(type="text", text=json.dumps(resultado, indent=2, ensure_ascii=False))]
-    
-    # ===== FERRAMENTA DESCONHECIDA =====
-    else:
+    if CEMADEN_DEBUG:
+        sys.stderr.write(
+            f"\n{'='*50}\n🔧 Executando: {name}\n📥 Argumentos: {arguments}\n{'='*50}\n\n"
+        )
+        sys.stderr.flush()
+    
+    ferramenta = _TOOL_DISPATCH.get(name)
+    if ferramenta is None:
         raise ValueError(f"Ferramenta desconhecida: {name}")
+    
+    # O SDK já valida os argumentos como objeto JSON (dict ou None)
+    args = arguments or {}
+    responder, parametros = ferramenta
+    return await responder(**{p: args.get(p) for p in parametros})
 
 
 # ====================
@@ -462,42 +843,44 @@ async def main():
     """
     Função principal que inicializa e executa o servidor MCP
     """
-    import sys
-    
-    # Pré-carrega dados de municípios
-    carregar_municipios()
+    # Gravação do log em arquivo em thread separada (esvaziada ao encerrar)
+    _LOG_LISTENER.start()
+    atexit.register(_LOG_LISTENER.stop)
+    logger.addHandler(_LOG_QUEUE_HANDLER)
     
     # Log de inicialização
-    try:
-        with open("cemaden_mcp_debug.log", "a", encoding="utf-8") as log_file:
-            log_file.write(f"\n{'='*60}\n")
-            log_file.write(f"🚀 Servidor iniciado: {datetime.now()}\n")
-            log_file.write(f"📡 Painel: {CEMADEN_PAINEL_BASE}\n")
-            log_file.write(f"🗺️  Mapa: {CEMADEN_MAPA_BASE}\n")
-            log_file.write(f"{'='*60}\n")
-    except:
-        pass
-    
-    print("🚀 Servidor MCP CEMADEN iniciado", file=sys.stderr)
-    print(f"📡 Painel: {CEMADEN_PAINEL_BASE}", file=sys.stderr)
-    print(f"🗺️  Mapa: {CEMADEN_MAPA_BASE}", file=sys.stderr)
-    print(f"📝 Log: cemaden_mcp_debug.log", file=sys.stderr)
-    print("="*50, file=sys.stderr)
+    logger.info(
+        "🚀 Servidor iniciado | 📡 Painel: %s | 🗺️  Mapa: %s",
+        CEMADEN_PAINEL_BASE,
+        CEMADEN_MAPA_BASE,
+    )
+    
+    sys.stderr.write(
+        "🚀 Servidor MCP CEMADEN iniciado\n"
+        f"📡 Painel: {CEMADEN_PAINEL_BASE}\n"
+        f"🗺️  Mapa: {CEMADEN_MAPA_BASE}\n"
+        f"📝 Log: {LOG_ARQUIVO}\n"
+        f"{'='*50}\n"
+    )
+    sys.stderr.flush()
     
     # Rodar servidor
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="cemaden-monitor-server",
-                server_version="2.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="cemaden-monitor-server",
+                    server_version="2.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await fechar_cliente_http()
 
 
 # ====================
@@ -505,8 +888,16 @@ async def main():
 # ====================
 
 if __name__ == "__main__":
+    # uvloop é opcional (não disponível no Windows); sem ele, ou em versões
+    # anteriores à 0.18 (sem uvloop.run), usa o asyncio padrão
+    try:
+        import uvloop
+        executar = uvloop.run
+    except (ImportError, AttributeError):
+        executar = asyncio.run
+    
     try:
-        asyncio.run(main())
+        executar(main())
     except KeyboardInterrupt:
         print("\n\n👋 Servidor encerrado")
     except Exception as e:
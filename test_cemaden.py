@@ -4,6 +4,7 @@ Script de teste para funções do CEMADEN
 Não requer servidor MCP, testa diretamente as funções
 """
 
+import asyncio
 import json
 import sys
 sys.path.insert(0, '.')
@@ -12,7 +13,8 @@ from cemaden_server import (
     buscar_info_painel_alertas,
     buscar_municipios_monitorados,
     buscar_info_monitoramento,
-    buscar_links_uteis
+    buscar_links_uteis,
+    buscar_dashboard_completo
 )
 
 def teste_com_separador(nome_teste):
@@ -21,10 +23,15 @@ def teste_com_separador(nome_teste):
     print(f"🧪 {nome_teste}")
     print(f"{'='*60}\n")
 
+def imprimir_json(resultado):
+    """Escreve o resultado como JSON indentado direto no stdout, sem montar a string inteira"""
+    json.dump(resultado, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
 # Teste 1: Painel de alertas
 teste_com_separador("TESTE 1: Painel de Alertas")
-resultado = buscar_info_painel_alertas()
-print(json.dumps(resultado, indent=2, ensure_ascii=False))
+resultado = asyncio.run(buscar_info_painel_alertas())
+imprimir_json(resultado)
 
 # Teste 2: Listar todos os municípios
 teste_com_separador("TESTE 2: Listar TODOS os municípios")
@@ -36,31 +43,44 @@ print(f"Estados disponíveis: {resultado.get('estados_disponiveis')}\n")
 # Teste 3: Listar municípios de SP
 teste_com_separador("TESTE 3: Listar municípios de SP")
 resultado = buscar_municipios_monitorados("SP")
-print(json.dumps(resultado, indent=2, ensure_ascii=False))
+imprimir_json(resultado)
 
 # Teste 4: Listar municípios de RJ
 teste_com_separador("TESTE 4: Listar municípios de RJ")
 resultado = buscar_municipios_monitorados("RJ")
-print(json.dumps(resultado, indent=2, ensure_ascii=False))
+imprimir_json(resultado)
 
 # Teste 5: Estado inválido (deve retornar erro com lista de válidos)
 teste_com_separador("TESTE 5: Estado INVÁLIDO (XX)")
 resultado = buscar_municipios_monitorados("XX")
-print(json.dumps(resultado, indent=2, ensure_ascii=False))
+imprimir_json(resultado)
 
 # Teste 6: Info do sistema
 teste_com_separador("TESTE 6: Informações do Sistema")
 resultado = buscar_info_monitoramento()
-print(json.dumps(resultado, indent=2, ensure_ascii=False))
+imprimir_json(resultado)
 
 # Teste 7: Links úteis
 teste_com_separador("TESTE 7: Links por categoria")
 resultado = buscar_links_uteis("alertas")
-print(json.dumps(resultado, indent=2, ensure_ascii=False))
+imprimir_json(resultado)
 
 teste_com_separador("TESTE 8: Todos os links")
 resultado = buscar_links_uteis()
-print(json.dumps(resultado, indent=2, ensure_ascii=False))
+imprimir_json(resultado)
+
+# Teste 9: Dashboard completo (painel + info + links)
+teste_com_separador("TESTE 9: Dashboard completo")
+resultado = asyncio.run(buscar_dashboard_completo())
+print(f"Seções: {list(resultado.keys())}")
+print(f"Painel acessível: {resultado['painel'].get('sucesso')}")
+
+# Teste 10: Parâmetros muito longos são rejeitados antes de normalizar
+teste_com_separador("TESTE 10: Parâmetros muito longos")
+resultado = buscar_municipios_monitorados("X" * 10_000)
+imprimir_json(resultado)
+resultado = buscar_links_uteis("x" * 10_000)
+imprimir_json(resultado)
 
 print(f"\n{'='*60}")
 print("✅ TODOS OS TESTES CONCLUÍDOS COM SUCESSO!")